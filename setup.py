@@ -39,7 +39,9 @@ setup(
         'TA-Lib>=0.5.0',
         'seaborn>=0.13.0',
         'requests>=2.31.0',
+        'httpx>=0.27.0',
         'python-dateutil>=2.9.0',
+        'pyarrow>=14.0.0',
         'colorama>=0.4.6',
     ],
     entry_points={
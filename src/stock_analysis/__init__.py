@@ -4,17 +4,22 @@ Stock Analysis Package
 A Python package for analyzing stock market data using technical and fundamental analysis.
 """
 
+import importlib
+
 __version__ = '1.0.0'
 __author__ = 'Your Name'
 __email__ = 'your.email@example.com'
 
-# Import main components
-from .main import StockAnalyzer
-from .data_fetcher import DataFetcher
-from .technical_analysis import TechnicalAnalyzer
-from .fundamental_analysis import FundamentalAnalyzer
-from .visualizer import Visualizer
-from .cli import main
+# Exported names mapped to their defining submodules; resolved lazily via
+# PEP 562 so importing the package doesn't drag in pandas/matplotlib
+_LAZY_IMPORTS = {
+    'StockAnalyzer': '.main',
+    'DataFetcher': '.data_fetcher',
+    'TechnicalAnalyzer': '.technical_analysis',
+    'FundamentalAnalyzer': '.fundamental_analysis',
+    'Visualizer': '.visualizer',
+    'main': '.cli',
+}
 
 __all__ = [
     'StockAnalyzer',
@@ -24,3 +29,19 @@ __all__ = [
     'Visualizer',
     'main'
 ]
+
+def __getattr__(name):
+    """Resolve exported names on first access (PEP 562)."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
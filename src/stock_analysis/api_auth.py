@@ -1,4 +1,6 @@
+import asyncio
 import time
+import threading
 from typing import Dict, Optional, Callable
 import logging
 from functools import wraps
@@ -6,8 +8,17 @@ import json
 import os
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
 
+# Browser-like User-Agent sent with every API request
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
 @dataclass
 class APICredentials:
     """Store API credentials"""
@@ -18,41 +29,52 @@ class APICredentials:
 
 class RateLimiter:
     """
-    Implements rate limiting for API calls
+    Implements token-bucket rate limiting for API calls
     """
-    
+
     def __init__(self, calls: int, period: int):
         """
         Initialize rate limiter
-        
+
         Args:
             calls: Number of calls allowed
             period: Time period in seconds
         """
         self.calls = calls
         self.period = period
-        self.timestamps = []
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last) * self.rate
+            )
+            self.last = now
+
+            # Let the bucket go negative so concurrent throttled callers
+            # each record their debt and queue behind one another
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        # Sleep outside the lock so throttled callers don't block
+        # other threads' bookkeeping
+        if wait > 0:
+            time.sleep(wait)
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator to implement rate limiting"""
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time.time()
-            
-            # Remove timestamps outside the window
-            self.timestamps = [
-                ts for ts in self.timestamps 
-                if ts > now - self.period
-            ]
-            
-            if len(self.timestamps) >= self.calls:
-                sleep_time = self.timestamps[0] - (now - self.period)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                    
-            self.timestamps.append(now)
+            self.acquire()
             return func(*args, **kwargs)
-            
+
         return wrapper
 
 class NSEAuthManager:
@@ -70,6 +92,31 @@ class NSEAuthManager:
         self.credentials_file = credentials_file
         self.credentials = self._load_credentials()
         self._setup_logging()
+        self._token_session = self._build_token_session()
+        self._cached_headers = None
+        self._cached_until = 0.0
+        self._dirty = False
+
+    @staticmethod
+    def _build_token_session() -> requests.Session:
+        """Create a pooled session for token refresh requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Token minting is idempotent; without this POST is
+                # excluded by urllib3's default allowed_methods and the
+                # retry config never fires
+                allowed_methods=frozenset({'POST'})
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def _setup_logging(self):
         """Configure logging"""
@@ -96,19 +143,25 @@ class NSEAuthManager:
             return APICredentials(api_key="")
 
     def _save_credentials(self):
-        """Save credentials to file"""
+        """Save credentials to file atomically, skipping unchanged state"""
+        if not self._dirty:
+            return
+
         try:
-            with open(self.credentials_file, 'w') as f:
-                json.dump(
-                    {
-                        'api_key': self.credentials.api_key,
-                        'api_secret': self.credentials.api_secret,
-                        'access_token': self.credentials.access_token,
-                        'token_expiry': self.credentials.token_expiry.isoformat() 
-                            if self.credentials.token_expiry else None
-                    },
-                    f
-                )
+            expiry = self.credentials.token_expiry
+            payload = {
+                'api_key': self.credentials.api_key,
+                'api_secret': self.credentials.api_secret,
+                'access_token': self.credentials.access_token,
+                'token_expiry': expiry.isoformat() if expiry else None
+            }
+            tmp_file = self.credentials_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(payload, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.credentials_file)
+            self._dirty = False
         except Exception as e:
             self.logger.error(f"Error saving credentials: {str(e)}")
 
@@ -128,21 +181,27 @@ class NSEAuthManager:
             api_key=api_key,
             api_secret=api_secret
         )
+        self._cached_headers = None
+        self._cached_until = 0.0
+        self._dirty = True
         self._save_credentials()
 
     def _generate_access_token(self) -> Optional[str]:
         """Generate new access token"""
         try:
-            response = requests.post(
+            response = self._token_session.post(
                 "https://api.nseindia.com/auth/token",
                 headers={
                     "X-API-KEY": self.credentials.api_key,
                     "X-API-SECRET": self.credentials.api_secret
-                }
+                },
+                timeout=(3.05, 10)
             )
             response.raise_for_status()
-            
-            data = response.json()
+
+            # Parse the raw bytes directly, skipping requests' charset
+            # detection and intermediate str decode
+            data = json.loads(response.content)
             return data.get('access_token')
         except Exception as e:
             self.logger.error(f"Error generating access token: {str(e)}")
@@ -155,8 +214,14 @@ class NSEAuthManager:
         Returns:
             Dictionary of headers including authentication
         """
+        mono_now = time.monotonic()
+        if self._cached_headers is not None and mono_now < self._cached_until:
+            # Copy so callers merging their own headers into the result
+            # can't pollute the cached dict
+            return dict(self._cached_headers)
+
         now = datetime.now()
-        
+
         # Check if token needs refresh
         if (
             not self.credentials.access_token or
@@ -167,17 +232,24 @@ class NSEAuthManager:
             if token:
                 self.credentials.access_token = token
                 self.credentials.token_expiry = now + timedelta(hours=1)
+                self._dirty = True
                 self._save_credentials()
-        
-        return {
+
+        headers = {
             "X-API-KEY": self.credentials.api_key,
             "Authorization": f"Bearer {self.credentials.access_token}"
                 if self.credentials.access_token else "",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/91.0.4472.124 Safari/537.36"
+            "User-Agent": USER_AGENT
         }
 
+        # Cache until shortly before the token expires (60s safety margin)
+        if self.credentials.token_expiry:
+            ttl = (self.credentials.token_expiry - now).total_seconds() - 60
+            self._cached_until = mono_now + max(0.0, ttl)
+            self._cached_headers = headers
+
+        return dict(headers)
+
 class APISession:
     """
     Manages API session with rate limiting and authentication
@@ -198,10 +270,54 @@ class APISession:
             rate_limit_period: Time period in seconds
         """
         self.auth_manager = auth_manager
-        self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_period)
+        self.rate_limit_calls = rate_limit_calls
+        self.rate_limit_period = rate_limit_period
+        self._prev_count = 0
+        self._curr_count = 0
+        self._window_start = time.monotonic()
+        self._limiter_lock = threading.Lock()
         self.session = requests.Session()
 
-    @RateLimiter(calls=100, period=60)
+    def _acquire(self):
+        """
+        Reserve one request slot using a sliding-window counter.
+
+        Tracks only the previous and current window counts, weighting the
+        previous window by how far into the current one we are, so the
+        limit is shared across all verbs with constant memory.
+        """
+        with self._limiter_lock:
+            now = time.monotonic()
+            elapsed = now - self._window_start
+
+            # Roll the window forward if it has expired
+            if elapsed >= self.rate_limit_period:
+                # More than one full period idle means both windows are stale
+                if elapsed >= 2 * self.rate_limit_period:
+                    self._prev_count = 0
+                else:
+                    self._prev_count = self._curr_count
+                self._curr_count = 0
+                self._window_start = now
+                elapsed = 0.0
+
+            weighted = (
+                self._prev_count * (1 - elapsed / self.rate_limit_period)
+                + self._curr_count
+            )
+
+            wait = 0.0
+            if weighted >= self.rate_limit_calls:
+                rate = self.rate_limit_calls / self.rate_limit_period
+                wait = (weighted - self.rate_limit_calls + 1) / rate
+
+            self._curr_count += 1
+
+        # Sleep outside the lock so throttled callers don't block
+        # other threads' bookkeeping
+        if wait > 0:
+            time.sleep(wait)
+
     def get(self, url: str, **kwargs) -> requests.Response:
         """
         Make GET request with rate limiting and authentication
@@ -210,16 +326,16 @@ class APISession:
             url: Request URL
             **kwargs: Additional request parameters
         """
+        self._acquire()
         headers = self.auth_manager.get_auth_headers()
         if 'headers' in kwargs:
             headers.update(kwargs['headers'])
         kwargs['headers'] = headers
-        
+
         response = self.session.get(url, **kwargs)
         response.raise_for_status()
         return response
 
-    @RateLimiter(calls=100, period=60)
     def post(self, url: str, **kwargs) -> requests.Response:
         """
         Make POST request with rate limiting and authentication
@@ -228,11 +344,106 @@ class APISession:
             url: Request URL
             **kwargs: Additional request parameters
         """
+        self._acquire()
         headers = self.auth_manager.get_auth_headers()
         if 'headers' in kwargs:
             headers.update(kwargs['headers'])
         kwargs['headers'] = headers
-        
+
         response = self.session.post(url, **kwargs)
         response.raise_for_status()
         return response
+
+class AsyncAPISession:
+    """
+    Async API session multiplexing requests over a shared connection pool
+    """
+
+    def __init__(
+        self,
+        auth_manager: NSEAuthManager,
+        rate_limit_calls: int = 100,
+        rate_limit_period: int = 60,
+        max_connections: int = 20
+    ):
+        """
+        Initialize async API session
+
+        Args:
+            auth_manager: Authentication manager instance
+            rate_limit_calls: Number of calls allowed in period
+            rate_limit_period: Time period in seconds
+            max_connections: Connection pool size
+        """
+        import httpx  # deferred so sync-only callers don't need it
+
+        self.auth_manager = auth_manager
+        self.rate_limit_calls = rate_limit_calls
+        self.rate_limit_period = rate_limit_period
+        self._rate = rate_limit_calls / rate_limit_period
+        self._tokens = float(rate_limit_calls)
+        self._last = time.monotonic()
+        self._limiter_lock = asyncio.Lock()
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+    async def _acquire(self):
+        """Take one token from the shared bucket, awaiting if exhausted."""
+        async with self._limiter_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit_calls,
+                self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _request(self, method: str, url: str, **kwargs):
+        """Issue one rate-limited, authenticated request."""
+        await self._acquire()
+        headers = await asyncio.to_thread(self.auth_manager.get_auth_headers)
+        if 'headers' in kwargs:
+            headers.update(kwargs['headers'])
+        kwargs['headers'] = headers
+
+        response = await self._client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def get(self, url: str, **kwargs):
+        """
+        Make async GET request with rate limiting and authentication
+
+        Args:
+            url: Request URL
+            **kwargs: Additional request parameters
+        """
+        return await self._request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        """
+        Make async POST request with rate limiting and authentication
+
+        Args:
+            url: Request URL
+            **kwargs: Additional request parameters
+        """
+        return await self._request('POST', url, **kwargs)
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    def run(self, coros):
+        """Run a batch of request coroutines to completion from sync code."""
+        async def _gather():
+            return await asyncio.gather(*coros)
+        return asyncio.run(_gather())
@@ -4,22 +4,19 @@ Command Line Interface for Stock Analyzer
 """
 
 import argparse
+import functools
+import re
+import string
 import sys
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-import colorama
-from colorama import Fore, Style
+from typing import Dict, List, Optional
 
-from .main import StockAnalyzer
 from . import __version__
 
-# Initialize colorama
-colorama.init()
-
-# ASCII Art Logo
-LOGO = f"""{Fore.CYAN}
+# ASCII Art Logo (colorama codes are filled in lazily by _logo())
+_LOGO_TEMPLATE = """{cyan}
 ╔═══════════════════════════════════════════════════════════════╗
 ║  ███████╗████████╗ ██████╗  ██████╗██╗  ██╗                  ║
 ║  ██╔════╝╚══██╔══╝██╔═══██╗██╔════╝██║ ██╔╝                  ║
@@ -34,44 +31,92 @@ LOGO = f"""{Fore.CYAN}
 ║    ██║  ██║██║ ╚████║██║  ██║███████╗██║   ███████╗███████║ ║
 ║    ╚═╝  ╚═╝╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝╚═╝   ╚══════╝╚══════╝ ║
 ╚═══════════════════════════════════════════════════════════════╝
-{Style.BRIGHT}{Fore.WHITE}Version: {__version__}{Style.RESET_ALL}
+{bright}{white}Version: {version}{reset}
 """
 
+@functools.lru_cache(maxsize=1)
+def _colors() -> Dict[str, str]:
+    """
+    Return the ANSI color codes used by the CLI, resolved once.
+
+    Codes are empty strings when stdout is not a tty, so redirected or
+    CI output skips the colorama wrapper and the escape sequences.
+    """
+    if not sys.stdout.isatty():
+        return {
+            'cyan': '', 'green': '', 'red': '', 'yellow': '',
+            'white': '', 'bright': '', 'reset': ''
+        }
+
+    import colorama
+    from colorama import Fore, Style
+
+    colorama.init()
+    return {
+        'cyan': Fore.CYAN,
+        'green': Fore.GREEN,
+        'red': Fore.RED,
+        'yellow': Fore.YELLOW,
+        'white': Fore.WHITE,
+        'bright': Style.BRIGHT,
+        'reset': Style.RESET_ALL
+    }
+
+@functools.lru_cache(maxsize=1)
+def _logo() -> str:
+    """Build the (optionally colored) logo on first use."""
+    return _LOGO_TEMPLATE.format(version=__version__, **_colors())
+
 # Configure logging
 def setup_logging(verbose: bool = False):
     """
     Set up logging configuration.
-    
+
     Args:
         verbose: If True, set log level to DEBUG
     """
+    colors = _colors()
     log_level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=log_level,
-        format=f'{Fore.YELLOW}%(asctime)s{Style.RESET_ALL} - %(name)s - %(levelname)s - %(message)s'
+        format=(
+            f"{colors['yellow']}%(asctime)s{colors['reset']}"
+            ' - %(name)s - %(levelname)s - %(message)s'
+        )
     )
 
 logger = logging.getLogger(__name__)
 
+# Precompiled validation helpers, built once at import.
+# Whitespace is tolerated around commas only; whitespace inside a token
+# must stay an error, so the uppercase table does not touch it.
+_SYMBOLS_RE = re.compile(r'\s*[A-Z0-9]+(?:\s*,\s*[A-Z0-9]+)*\s*')
+_VALID_INDICATORS = frozenset({'RSI', 'MACD', 'BB'})
+_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_lowercase, string.ascii_uppercase
+)
+
 def validate_symbols(symbols: str) -> List[str]:
     """
     Validate stock symbols.
-    
+
     Args:
         symbols: Comma-separated list of stock symbols
-        
+
     Returns:
         List of validated stock symbols
     """
     if not symbols:
         raise ValueError("Stock symbols must be provided")
-    
-    symbol_list = [s.strip().upper() for s in symbols.split(',')]
-    
-    if not all(symbol.isalnum() for symbol in symbol_list):
+
+    normalized = symbols.translate(_NORMALIZE_TABLE)
+
+    # One regex pass over the whole input instead of per-element checks;
+    # embedded whitespace inside a symbol fails the match
+    if not _SYMBOLS_RE.fullmatch(normalized):
         raise ValueError("Stock symbols must be alphanumeric")
-    
-    return symbol_list
+
+    return [symbol.strip() for symbol in normalized.split(',')]
 
 def validate_period(period: int) -> int:
     """
@@ -101,11 +146,13 @@ def validate_indicators(indicators: str) -> List[str]:
     """
     if not indicators:
         return ['RSI', 'MACD']  # Default indicators
-    
-    valid_indicators = {'RSI', 'MACD', 'BB'}
-    indicator_list = [i.strip().upper() for i in indicators.split(',')]
-    
-    invalid = set(indicator_list) - valid_indicators
+
+    indicator_list = [
+        token.strip()
+        for token in indicators.translate(_NORMALIZE_TABLE).split(',')
+    ]
+
+    invalid = set(indicator_list) - _VALID_INDICATORS
     if invalid:
         raise ValueError(f"Invalid indicators: {', '.join(invalid)}")
     
@@ -228,13 +275,22 @@ def main(argv: Optional[List[str]] = None) -> int:
     """
     try:
         args = parse_args(argv or sys.argv[1:])
+
+        # Heavy import deferred until after arg parsing so --help and
+        # --version stay fast
+        from .main import StockAnalyzer
+
         setup_logging(args.verbose)
-        
-        # Display logo and start message
-        print(LOGO)
-        print(f"{Fore.GREEN}Stock Analysis Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60 + Style.RESET_ALL)
-        print()
+        colors = _colors()
+
+        # Display logo and start message in one buffered write
+        sys.stdout.write(''.join([
+            _logo(), '\n',
+            colors['green'],
+            f"Stock Analysis Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            '=' * 60, colors['reset'], '\n\n'
+        ]))
+        sys.stdout.flush()
 
         # Validate inputs
         symbols = validate_symbols(args.symbols)
@@ -254,21 +310,26 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Run analysis
         analyzer.run()
         
-        # Display completion message
-        print()
-        print(f"{Fore.GREEN}Analysis completed successfully!")
-        print(f"Charts have been saved to: {output_dir}")
-        print("=" * 60 + Style.RESET_ALL)
-        
+        # Display completion message in one buffered write
+        sys.stdout.write(''.join([
+            '\n', colors['green'],
+            'Analysis completed successfully!\n',
+            f'Charts have been saved to: {output_dir}\n',
+            '=' * 60, colors['reset'], '\n'
+        ]))
+        sys.stdout.flush()
+
         return 0
-        
+
     except KeyboardInterrupt:
-        print(f"\n{Fore.RED}Analysis interrupted by user{Style.RESET_ALL}")
+        colors = _colors()
+        print(f"\n{colors['red']}Analysis interrupted by user{colors['reset']}")
         return 1
-        
+
     except Exception as e:
+        colors = _colors()
         logger.error(f"Error during analysis: {str(e)}", exc_info=True)
-        print(f"\n{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print(f"\n{colors['red']}Error: {str(e)}{colors['reset']}")
         return 1
 
 if __name__ == '__main__':
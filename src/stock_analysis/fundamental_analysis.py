@@ -1,124 +1,130 @@
 """Fundamental analysis module for stock analysis."""
 
 import logging
-from typing import Dict, Any, Optional
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+# (key, low, high) ranges for each mock metric group, kept as parallel
+# constant arrays so each method needs a single vectorized draw
+_FUND_KEYS = (
+    'pe_ratio', 'pb_ratio', 'debt_equity', 'current_ratio', 'quick_ratio',
+    'roe', 'roa', 'eps', 'dividend_yield', 'market_cap'
+)
+_FUND_LO = np.array([10, 1, 0, 1, 0.5, 5, 3, 5, 1, 1000], dtype=np.float64)
+_FUND_HI = np.array([30, 5, 2, 3, 2, 25, 15, 50, 5, 100000], dtype=np.float64)
+
+_RATIO_KEYS = (
+    'gross_margin', 'operating_margin', 'net_margin',
+    'asset_turnover', 'inventory_turnover', 'receivables_turnover'
+)
+_RATIO_LO = np.array([20, 10, 5, 0.5, 4, 6], dtype=np.float64)
+_RATIO_HI = np.array([60, 40, 30, 2, 12, 15], dtype=np.float64)
+
+_GROWTH_KEYS = (
+    'revenue_growth', 'earnings_growth', 'dividend_growth', 'book_value_growth'
+)
+_GROWTH_LO = np.array([5, 0, 0, 5], dtype=np.float64)
+_GROWTH_HI = np.array([25, 30, 15, 20], dtype=np.float64)
+
+_RISK_KEYS = ('beta', 'volatility', 'sharpe_ratio', 'alpha')
+_RISK_LO = np.array([0.5, 15, 0.5, -5], dtype=np.float64)
+_RISK_HI = np.array([1.5, 45, 2.5, 5], dtype=np.float64)
 
 class FundamentalAnalyzer:
     """Class for fundamental analysis of stocks."""
-    
+
     def __init__(self):
         """Initialize fundamental analyzer."""
         self.logger = logging.getLogger(__name__)
-    
+        self._rng = np.random.default_rng()
+
+    def _draw_metrics(self, keys, lows, highs) -> Dict[str, float]:
+        """Draw one vector of uniform mock values and map it to keys."""
+        vals = np.round(self._rng.uniform(lows, highs), 2).tolist()
+        return dict(zip(keys, vals))
+
     def get_fundamental_metrics(self, symbol: str) -> Dict[str, float]:
         """
         Get fundamental metrics for a stock.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
             Dict containing fundamental metrics
         """
         try:
             # Mock implementation - in a real system, we would fetch this data
             # from financial APIs or databases
-            return {
-                'pe_ratio': round(random.uniform(10, 30), 2),
-                'pb_ratio': round(random.uniform(1, 5), 2),
-                'debt_equity': round(random.uniform(0, 2), 2),
-                'current_ratio': round(random.uniform(1, 3), 2),
-                'quick_ratio': round(random.uniform(0.5, 2), 2),
-                'roe': round(random.uniform(5, 25), 2),
-                'roa': round(random.uniform(3, 15), 2),
-                'eps': round(random.uniform(5, 50), 2),
-                'dividend_yield': round(random.uniform(1, 5), 2),
-                'market_cap': round(random.uniform(1000, 100000), 2)
-            }
-            
+            return self._draw_metrics(_FUND_KEYS, _FUND_LO, _FUND_HI)
+
         except Exception as e:
             self.logger.error(f"Error getting fundamental metrics for {symbol}: {str(e)}")
             return {}
-    
+
     def get_financial_ratios(self, symbol: str) -> Dict[str, float]:
         """
         Get financial ratios for a stock.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
             Dict containing financial ratios
         """
         try:
             # Mock implementation
-            return {
-                'gross_margin': round(random.uniform(20, 60), 2),
-                'operating_margin': round(random.uniform(10, 40), 2),
-                'net_margin': round(random.uniform(5, 30), 2),
-                'asset_turnover': round(random.uniform(0.5, 2), 2),
-                'inventory_turnover': round(random.uniform(4, 12), 2),
-                'receivables_turnover': round(random.uniform(6, 15), 2)
-            }
-            
+            return self._draw_metrics(_RATIO_KEYS, _RATIO_LO, _RATIO_HI)
+
         except Exception as e:
             self.logger.error(f"Error getting financial ratios for {symbol}: {str(e)}")
             return {}
-    
+
     def get_growth_metrics(self, symbol: str) -> Dict[str, float]:
         """
         Get growth metrics for a stock.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
             Dict containing growth metrics
         """
         try:
             # Mock implementation
-            return {
-                'revenue_growth': round(random.uniform(5, 25), 2),
-                'earnings_growth': round(random.uniform(0, 30), 2),
-                'dividend_growth': round(random.uniform(0, 15), 2),
-                'book_value_growth': round(random.uniform(5, 20), 2)
-            }
-            
+            return self._draw_metrics(_GROWTH_KEYS, _GROWTH_LO, _GROWTH_HI)
+
         except Exception as e:
             self.logger.error(f"Error getting growth metrics for {symbol}: {str(e)}")
             return {}
-    
+
     def get_risk_metrics(self, symbol: str) -> Dict[str, float]:
         """
         Get risk metrics for a stock.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
             Dict containing risk metrics
         """
         try:
             # Mock implementation
-            return {
-                'beta': round(random.uniform(0.5, 1.5), 2),
-                'volatility': round(random.uniform(15, 45), 2),
-                'sharpe_ratio': round(random.uniform(0.5, 2.5), 2),
-                'alpha': round(random.uniform(-5, 5), 2)
-            }
-            
+            return self._draw_metrics(_RISK_KEYS, _RISK_LO, _RISK_HI)
+
         except Exception as e:
             self.logger.error(f"Error getting risk metrics for {symbol}: {str(e)}")
             return {}
-    
+
     def analyze(self, symbol: str) -> Dict[str, Dict[str, float]]:
         """
         Perform comprehensive fundamental analysis.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
             Dict containing all fundamental analysis results
         """
@@ -129,7 +135,34 @@ class FundamentalAnalyzer:
                 'growth_metrics': self.get_growth_metrics(symbol),
                 'risk_metrics': self.get_risk_metrics(symbol)
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error performing fundamental analysis for {symbol}: {str(e)}")
             return {}
+
+    def analyze_many(
+        self,
+        symbols: List[str],
+        max_workers: int = 10
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Perform fundamental analysis for multiple symbols in parallel.
+
+        Args:
+            symbols: List of stock symbols
+            max_workers: Maximum number of worker threads
+
+        Returns:
+            Dict mapping each symbol to its analysis results
+        """
+        # Bound in-flight work so a long symbol list can't queue unbounded
+        semaphore = threading.Semaphore(max_workers * 2)
+
+        def _analyze(symbol: str) -> Dict[str, Dict[str, float]]:
+            with semaphore:
+                return self.analyze(symbol)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_analyze, symbols)
+
+        return dict(zip(symbols, results))
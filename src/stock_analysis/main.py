@@ -10,7 +10,7 @@ import pandas as pd
 import argparse
 
 from .data_fetcher import DataFetcher
-from .technical_analysis import TechnicalAnalyzer
+from .technical_analysis import TechnicalAnalyzer, _kernel_array, analyze_batch
 from .fundamental_analysis import FundamentalAnalyzer
 from .visualizer import Visualizer
 
@@ -33,23 +33,30 @@ class StockAnalyzer:
             period: Analysis period in days
             indicators: List of technical indicators to calculate
             chart_type: Type of chart to generate
-            output_dir: Directory to save charts
+            output_dir: Directory to save charts; None skips chart
+                generation entirely
         """
         self._setup_logging()
         self.data_fetcher = DataFetcher()
         self.tech_analyzer = TechnicalAnalyzer()
         self.fund_analyzer = FundamentalAnalyzer()
-        self.visualizer = Visualizer()
-        
+
         # Store parameters
         self.symbols = symbols
         self.period = period
         self.indicators = indicators or ['RSI', 'MACD']
+        # Frozen once for O(1) membership tests in every analyze call
+        self._indicator_set = frozenset(self.indicators)
         self.chart_type = chart_type
-        self.output_dir = output_dir or Path('stock_charts')
-        
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+
+        # The visualizer pulls in the plotting stack, so analysis-only
+        # runs (no output directory) never construct or import it
+        if self.output_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.visualizer = Visualizer()
+        else:
+            self.visualizer = None
     
     def _setup_logging(self):
         """Set up logging configuration."""
@@ -69,51 +76,59 @@ class StockAnalyzer:
         try:
             # Log analysis start
             self.logger.info(f"Analyzing {', '.join(self.symbols)}...")
-            
+
             # Calculate date range
             end_date = datetime.now()
             start_date = end_date - timedelta(days=self.period)
-            
-            results = {}
+
+            # Fetch all symbols concurrently, dropping the ones with no data
+            frames = self.data_fetcher.fetch_all(
+                self.symbols, start_date, end_date
+            )
+            fetched = []
             for symbol in self.symbols:
-                # Fetch data
-                data = self.data_fetcher.get_historical_data(
-                    symbol,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                if data.empty:
+                if frames[symbol].empty:
                     self.logger.warning(f"No data available for {symbol}")
-                    continue
-                
-                # Set data for technical analysis
-                self.tech_analyzer.set_data(data)
-                
-                # Perform technical analysis
-                tech_results = self.tech_analyzer.analyze(self.indicators)
-                
-                # Generate charts
+                else:
+                    fetched.append((symbol, frames[symbol]))
+
+            # One parallel kernel call analyzes the whole batch
+            closes = [_kernel_array(data['CLOSE']) for _, data in fetched]
+            tech_results = analyze_batch(closes, self._indicator_set)
+
+            results = {}
+            for (symbol, data), tech in zip(fetched, tech_results):
                 if self.output_dir:
-                    self.visualizer.plot_stock_data(
-                        data,
-                        symbol,
-                        chart_type=self.chart_type,
-                        indicators=self.indicators,
-                        output_dir=self.output_dir
-                    )
-                
-                # Store results
+                    self._plot_symbol(symbol, data)
+
                 results[symbol] = {
-                    'technical_indicators': tech_results,
+                    'technical_indicators': tech,
                     'current_data': self.data_fetcher.get_current_data(symbol)
                 }
-            
+
             return results
-            
+
         except Exception as e:
             self.logger.error(f"Error during analysis: {str(e)}", exc_info=True)
             raise
+
+    def _plot_symbol(self, symbol: str, data: pd.DataFrame) -> None:
+        """
+        Generate the charts for one symbol.
+
+        The shared analyzer supplies the full indicator series so the
+        visualizer doesn't recompute them; plotting stays sequential
+        since matplotlib's pyplot state machine is not thread-safe.
+        """
+        self.tech_analyzer.set_data(data)
+        self.visualizer.plot_stock_data(
+            data,
+            symbol,
+            chart_type=self.chart_type,
+            indicators=self.indicators,
+            output_dir=self.output_dir,
+            indicator_series=self.tech_analyzer.get_indicator_series()
+        )
     
     def _print_analysis_report(self, results: Dict):
         """
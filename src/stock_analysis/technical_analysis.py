@@ -1,11 +1,402 @@
 """Technical analysis module for stock analysis."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _HAS_NUMBA = False
+
+def _kernel_array(series: pd.Series) -> np.ndarray:
+    """C-contiguous, writeable float64 view of a series for the kernels."""
+    arr = np.ascontiguousarray(series.to_numpy(), dtype=np.float64)
+    if not arr.flags.writeable:
+        # The explicit f8[::1] signatures reject readonly buffers
+        # (e.g. columns loaded from Parquet)
+        arr = arr.copy()
+    return arr
+
+if _HAS_NUMBA:
+    # Explicit signatures compile the kernels at import time (and cache the
+    # artifacts on disk), so short-lived CLI runs never pay lazy-JIT cost
+    @njit("f8(f8[::1], i8)", cache=True, fastmath=True, nogil=True)
+    def _rsi_last(close, period):
+        """
+        Return the last RSI value with Wilder smoothing in one pass.
+
+        Seeds the average gain/loss from the first `period` deltas, then
+        applies the Wilder recurrence, keeping only scalar state.
+        """
+        n = close.shape[0]
+        avg_gain = 0.0
+        avg_loss = 0.0
+
+        for i in range(1, period + 1):
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                avg_gain += delta
+            else:
+                avg_loss -= delta
+        avg_gain /= period
+        avg_loss /= period
+
+        for i in range(period + 1, n):
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    @njit("UniTuple(f8, 3)(f8[::1], i8, i8, i8)", cache=True, fastmath=True, nogil=True)
+    def _macd_last(close, fast, slow, signal):
+        """
+        Return the last (macd_line, signal_line, histogram) values.
+
+        Runs the three EMA recurrences as one fused scalar loop with O(1)
+        memory, seeded from the first close like ewm(adjust=False).
+        """
+        alpha_fast = 2.0 / (fast + 1)
+        alpha_slow = 2.0 / (slow + 1)
+        alpha_sig = 2.0 / (signal + 1)
+        fast_ema = close[0]
+        slow_ema = close[0]
+        macd = 0.0
+        sig = 0.0
+
+        for i in range(1, close.shape[0]):
+            x = close[i]
+            fast_ema += alpha_fast * (x - fast_ema)
+            slow_ema += alpha_slow * (x - slow_ema)
+            macd = fast_ema - slow_ema
+            sig += alpha_sig * (macd - sig)
+
+        return macd, sig, macd - sig
+
+    @njit("UniTuple(f8, 3)(f8[::1], i8, f8)", cache=True, fastmath=True, nogil=True)
+    def _bb_last(close, period, num_std):
+        """
+        Return the last (upper, middle, lower) Bollinger band values.
+
+        A ring buffer with running sum and sum of squares replaces the
+        separate rolling mean and rolling std passes, so the mean and the
+        sample standard deviation come out of one scan.
+        """
+        buf = np.empty(period, dtype=np.float64)
+        total = 0.0
+        total_sq = 0.0
+
+        for i in range(close.shape[0]):
+            x = close[i]
+            j = i % period
+            if i >= period:
+                old = buf[j]
+                total -= old
+                total_sq -= old * old
+            buf[j] = x
+            total += x
+            total_sq += x * x
+
+        mean = total / period
+        # Sample variance (ddof=1), matching pandas rolling().std()
+        var = (total_sq - total * total / period) / (period - 1)
+        std = np.sqrt(var) if var > 0.0 else 0.0
+
+        return mean + num_std * std, mean, mean - num_std * std
+
+    @njit("UniTuple(f8, 7)(f8[::1], i8, i8, i8, i8, i8, f8)", cache=True, fastmath=True, nogil=True)
+    def _analyze_all(close, rsi_p, fast, slow, signal, bb_p, bb_std):
+        """
+        Stream the close series once, updating RSI, MACD and Bollinger state
+        together.
+
+        Returns (rsi, macd_line, signal_line, histogram, upper, middle, lower)
+        for the final bar. Values whose warm-up exceeds the series length are
+        garbage and must be masked by the caller.
+        """
+        n = close.shape[0]
+
+        # MACD EMA state (seeded from the first close, as ewm(adjust=False))
+        alpha_fast = 2.0 / (fast + 1)
+        alpha_slow = 2.0 / (slow + 1)
+        alpha_sig = 2.0 / (signal + 1)
+        fast_ema = close[0]
+        slow_ema = close[0]
+        macd = 0.0
+        sig = 0.0
+
+        # RSI Wilder state
+        avg_gain = 0.0
+        avg_loss = 0.0
+
+        # Bollinger ring buffer with running sum / sum of squares
+        buf = np.empty(bb_p, dtype=np.float64)
+        total = 0.0
+        total_sq = 0.0
+
+        for i in range(n):
+            x = close[i]
+
+            if i > 0:
+                fast_ema += alpha_fast * (x - fast_ema)
+                slow_ema += alpha_slow * (x - slow_ema)
+                macd = fast_ema - slow_ema
+                sig += alpha_sig * (macd - sig)
+
+                delta = x - close[i - 1]
+                gain = delta if delta > 0 else 0.0
+                loss = -delta if delta < 0 else 0.0
+                if i <= rsi_p:
+                    avg_gain += gain
+                    avg_loss += loss
+                    if i == rsi_p:
+                        avg_gain /= rsi_p
+                        avg_loss /= rsi_p
+                else:
+                    avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+                    avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+
+            j = i % bb_p
+            if i >= bb_p:
+                old = buf[j]
+                total -= old
+                total_sq -= old * old
+            buf[j] = x
+            total += x
+            total_sq += x * x
+
+        if avg_loss == 0.0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        mean = total / bb_p
+        # Sample variance (ddof=1), matching pandas rolling().std()
+        var = (total_sq - total * total / bb_p) / (bb_p - 1)
+        std = np.sqrt(var) if var > 0.0 else 0.0
+
+        return (
+            rsi, macd, sig, macd - sig,
+            mean + bb_std * std, mean, mean - bb_std * std
+        )
+
+    @njit(
+        "Tuple((f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1]))"
+        "(f8[::1], i8, i8, i8, i8, i8, f8)",
+        cache=True, fastmath=True, nogil=True
+    )
+    def _analyze_series(close, rsi_p, fast, slow, signal, bb_p, bb_std):
+        """
+        Full-series variant of the fused kernel for plotting.
+
+        Returns (rsi, macd_line, signal_line, upper, middle, lower) arrays,
+        with NaN before each indicator's warm-up completes.
+        """
+        n = close.shape[0]
+        rsi = np.full(n, np.nan)
+        macd_line = np.empty(n)
+        sig_line = np.empty(n)
+        upper = np.full(n, np.nan)
+        middle = np.full(n, np.nan)
+        lower = np.full(n, np.nan)
+
+        alpha_fast = 2.0 / (fast + 1)
+        alpha_slow = 2.0 / (slow + 1)
+        alpha_sig = 2.0 / (signal + 1)
+        fast_ema = close[0]
+        slow_ema = close[0]
+        macd = 0.0
+        sig = 0.0
+
+        avg_gain = 0.0
+        avg_loss = 0.0
+
+        buf = np.empty(bb_p, dtype=np.float64)
+        total = 0.0
+        total_sq = 0.0
+
+        for i in range(n):
+            x = close[i]
+
+            if i > 0:
+                fast_ema += alpha_fast * (x - fast_ema)
+                slow_ema += alpha_slow * (x - slow_ema)
+                macd = fast_ema - slow_ema
+                sig += alpha_sig * (macd - sig)
+
+                delta = x - close[i - 1]
+                gain = delta if delta > 0 else 0.0
+                loss = -delta if delta < 0 else 0.0
+                if i <= rsi_p:
+                    avg_gain += gain
+                    avg_loss += loss
+                    if i == rsi_p:
+                        avg_gain /= rsi_p
+                        avg_loss /= rsi_p
+                else:
+                    avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+                    avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+
+            macd_line[i] = macd
+            sig_line[i] = sig
+
+            if i >= rsi_p:
+                if avg_loss == 0.0:
+                    rsi[i] = 100.0
+                else:
+                    rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+            j = i % bb_p
+            if i >= bb_p:
+                old = buf[j]
+                total -= old
+                total_sq -= old * old
+            buf[j] = x
+            total += x
+            total_sq += x * x
+
+            if i >= bb_p - 1:
+                mean = total / bb_p
+                var = (total_sq - total * total / bb_p) / (bb_p - 1)
+                std = np.sqrt(var) if var > 0.0 else 0.0
+                middle[i] = mean
+                upper[i] = mean + bb_std * std
+                lower[i] = mean - bb_std * std
+
+        return rsi, macd_line, sig_line, upper, middle, lower
+
+    @njit(
+        "f8[:, ::1](f8[:, ::1], i8[::1], i8, i8, i8, i8, i8, f8)",
+        parallel=True, cache=True, fastmath=True, nogil=True
+    )
+    def _analyze_batch(closes, lengths, rsi_p, fast, slow, signal, bb_p, bb_std):
+        """
+        Run the fused last-value kernel over a padded batch of close series.
+
+        Each row of `closes` holds one symbol's closes, padded to the longest
+        series; `lengths` gives the valid prefix per row. Rows are analyzed
+        in parallel, so a batch costs one Python-to-native crossing and
+        scales across cores.
+        """
+        m = closes.shape[0]
+        out = np.empty((m, 7), dtype=np.float64)
+        for i in prange(m):
+            row = _analyze_all(
+                closes[i, :lengths[i]], rsi_p, fast, slow, signal, bb_p, bb_std
+            )
+            for j in range(7):
+                out[i, j] = row[j]
+        return out
+
+else:
+    # Pure-numpy fallbacks keep the module importable without numba,
+    # trading the fused single-pass kernels for vectorized equivalents
+
+    def _wilder_averages(close, period):
+        """Wilder-smoothed gain/loss averages from index `period` onward."""
+        delta = np.diff(close)
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
+
+        # Seed with the first-period means, then run the exact Wilder
+        # recurrence over the remaining deltas via ewm(alpha=1/period)
+        g = np.empty(delta.shape[0] - period + 1)
+        l = np.empty_like(g)
+        g[0] = gain[:period].mean()
+        g[1:] = gain[period:]
+        l[0] = loss[:period].mean()
+        l[1:] = loss[period:]
+        alpha = 1.0 / period
+        avg_gain = pd.Series(g).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        avg_loss = pd.Series(l).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        return avg_gain, avg_loss
+
+    def _rsi_last(close, period):
+        avg_gain, avg_loss = _wilder_averages(close, period)
+        if avg_loss[-1] == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain[-1] / avg_loss[-1])
+
+    def _macd_pair(close, fast, slow, signal):
+        s = pd.Series(close)
+        macd = (
+            s.ewm(span=fast, adjust=False).mean()
+            - s.ewm(span=slow, adjust=False).mean()
+        ).to_numpy()
+        sig = pd.Series(macd).ewm(span=signal, adjust=False).mean().to_numpy()
+        return macd, sig
+
+    def _macd_last(close, fast, slow, signal):
+        macd, sig = _macd_pair(close, fast, slow, signal)
+        return macd[-1], sig[-1], macd[-1] - sig[-1]
+
+    def _rolling_mean_std(close, period):
+        """Prefix-sum rolling mean/std, avoiding the rolling() machinery."""
+        c1 = np.concatenate(([0.0], np.cumsum(close)))
+        c2 = np.concatenate(([0.0], np.cumsum(close * close)))
+        s1 = c1[period:] - c1[:-period]
+        s2 = c2[period:] - c2[:-period]
+        mean = s1 / period
+        # Sample variance (ddof=1), matching pandas rolling().std()
+        var = np.maximum(0.0, (s2 - s1 * s1 / period) / (period - 1))
+        return mean, np.sqrt(var)
+
+    def _bb_last(close, period, num_std):
+        window = close[-period:]
+        mean = window.mean()
+        std = window.std(ddof=1)
+        return mean + num_std * std, mean, mean - num_std * std
+
+    def _analyze_all(close, rsi_p, fast, slow, signal, bb_p, bb_std):
+        n = close.shape[0]
+        rsi = _rsi_last(close, rsi_p) if n > rsi_p else np.nan
+        macd, sig, hist = _macd_last(close, fast, slow, signal)
+        if n >= bb_p:
+            upper, middle, lower = _bb_last(close, bb_p, bb_std)
+        else:
+            upper = middle = lower = np.nan
+        return rsi, macd, sig, hist, upper, middle, lower
+
+    def _analyze_series(close, rsi_p, fast, slow, signal, bb_p, bb_std):
+        n = close.shape[0]
+        rsi = np.full(n, np.nan)
+        upper = np.full(n, np.nan)
+        middle = np.full(n, np.nan)
+        lower = np.full(n, np.nan)
+
+        if n > rsi_p:
+            avg_gain, avg_loss = _wilder_averages(close, rsi_p)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vals = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            vals[avg_loss == 0.0] = 100.0
+            rsi[rsi_p:] = vals
+
+        macd_line, sig_line = _macd_pair(close, fast, slow, signal)
+
+        if n >= bb_p:
+            mean, std = _rolling_mean_std(close, bb_p)
+            middle[bb_p - 1:] = mean
+            upper[bb_p - 1:] = mean + bb_std * std
+            lower[bb_p - 1:] = mean - bb_std * std
+
+        return rsi, macd_line, sig_line, upper, middle, lower
+
+    def _analyze_batch(closes, lengths, rsi_p, fast, slow, signal, bb_p, bb_std):
+        out = np.empty((closes.shape[0], 7), dtype=np.float64)
+        for i in range(closes.shape[0]):
+            out[i] = _analyze_all(
+                closes[i, :lengths[i]], rsi_p, fast, slow, signal, bb_p, bb_std
+            )
+        return out
+
 @dataclass
 class TechnicalIndicators:
     """Class to hold technical indicator values."""
@@ -20,10 +411,48 @@ class TechnicalAnalyzer:
         """Initialize technical analyzer."""
         self.logger = logging.getLogger(__name__)
         self.data = None
-    
+        self._close = None
+        self._n = 0
+        self._series_cache = None
+
     def set_data(self, data: pd.DataFrame) -> None:
-        """Set the data for analysis."""
+        """Set the data for analysis, materializing CLOSE once for kernels."""
         self.data = data
+        self._close = None if data is None else _kernel_array(data['CLOSE'])
+        self._n = 0 if self._close is None else self._close.shape[0]
+        self._series_cache = None
+
+    def get_indicator_series(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Get the full indicator series for the current data, for plotting.
+
+        Computed lazily from one fused pass and cached until set_data is
+        called again, so the visualizer never repeats the analyzer's work.
+
+        Returns:
+            Dict of named indicator arrays, or None if no data is set
+        """
+        if self._close is None or self._n < 2:
+            return None
+
+        if self._series_cache is None:
+            try:
+                rsi, macd, sig, upper, middle, lower = _analyze_series(
+                    self._close, 14, 12, 26, 9, 20, 2.0
+                )
+                self._series_cache = {
+                    'RSI': rsi,
+                    'MACD': macd,
+                    'MACD_SIGNAL': sig,
+                    'BB_UPPER': upper,
+                    'BB_MIDDLE': middle,
+                    'BB_LOWER': lower
+                }
+            except Exception as e:
+                self.logger.error(f"Error computing indicator series: {str(e)}")
+                return None
+
+        return self._series_cache
     
     def calculate_rsi(self, period: int = 14) -> float:
         """
@@ -35,27 +464,13 @@ class TechnicalAnalyzer:
         Returns:
             RSI value
         """
-        if self.data is None or len(self.data) < period:
+        # The Wilder seed consumes `period` deltas, i.e. period + 1 bars
+        if self._close is None or self._n <= period:
             return None
-            
+
         try:
-            # Calculate price changes
-            delta = self.data['CLOSE'].diff()
-            
-            # Separate gains and losses
-            gains = delta.where(delta > 0, 0)
-            losses = -delta.where(delta < 0, 0)
-            
-            # Calculate average gains and losses
-            avg_gains = gains.rolling(window=period).mean()
-            avg_losses = losses.rolling(window=period).mean()
-            
-            # Calculate RS and RSI
-            rs = avg_gains / avg_losses
-            rsi = 100 - (100 / (1 + rs))
-            
-            return float(rsi.iloc[-1])
-            
+            return float(_rsi_last(self._close, period))
+
         except Exception as e:
             self.logger.error(f"Error calculating RSI: {str(e)}")
             return None
@@ -72,27 +487,25 @@ class TechnicalAnalyzer:
         Returns:
             Dict containing MACD line, signal line, and histogram values
         """
-        if self.data is None or len(self.data) < slow_period:
+        if self._close is None or self._n < slow_period:
             return None
             
         try:
-            # Calculate EMAs
-            fast_ema = self.data['CLOSE'].ewm(span=fast_period, adjust=False).mean()
-            slow_ema = self.data['CLOSE'].ewm(span=slow_period, adjust=False).mean()
-            
-            # Calculate MACD line and signal line
-            macd_line = fast_ema - slow_ema
-            signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-            
-            # Calculate histogram
-            histogram = macd_line - signal_line
-            
+            # EMA weights decay geometrically, so seeding from a tail of
+            # 5x the slow span reproduces the full-history recurrence to
+            # well below float display precision, in O(period) work
+            tail = 5 * slow_period
+            close = self._close[-tail:] if self._close.shape[0] > tail else self._close
+            macd_line, signal_line, histogram = _macd_last(
+                close, fast_period, slow_period, signal_period
+            )
+
             return {
-                'macd_line': float(macd_line.iloc[-1]),
-                'signal_line': float(signal_line.iloc[-1]),
-                'histogram': float(histogram.iloc[-1])
+                'macd_line': float(macd_line),
+                'signal_line': float(signal_line),
+                'histogram': float(histogram)
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error calculating MACD: {str(e)}")
             return None
@@ -108,52 +521,124 @@ class TechnicalAnalyzer:
         Returns:
             Dict containing upper band, middle band, and lower band values
         """
-        if self.data is None or len(self.data) < period:
+        if self._close is None or self._n < period:
             return None
-            
+
         try:
-            # Calculate middle band (SMA)
-            middle_band = self.data['CLOSE'].rolling(window=period).mean()
-            
-            # Calculate standard deviation
-            std = self.data['CLOSE'].rolling(window=period).std()
-            
-            # Calculate upper and lower bands
-            upper_band = middle_band + (std * num_std)
-            lower_band = middle_band - (std * num_std)
-            
+            # The last bands only depend on the final `period` closes
+            upper_band, middle_band, lower_band = _bb_last(
+                self._close[-period:], period, num_std
+            )
+
             return {
-                'upper_band': float(upper_band.iloc[-1]),
-                'middle_band': float(middle_band.iloc[-1]),
-                'lower_band': float(lower_band.iloc[-1])
+                'upper_band': float(upper_band),
+                'middle_band': float(middle_band),
+                'lower_band': float(lower_band)
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error calculating Bollinger Bands: {str(e)}")
             return None
     
-    def analyze(self, indicators: List[str]) -> TechnicalIndicators:
+    def analyze(self, indicators: FrozenSet[str]) -> TechnicalIndicators:
         """
         Perform technical analysis for specified indicators.
-        
+
         Args:
-            indicators: List of indicators to calculate
-            
+            indicators: Set of indicators to calculate; a frozenset gives
+                O(1) membership checks, though any container works
+
         Returns:
             Dict containing calculated indicators
         """
-        if self.data is None:
+        if self._close is None:
             return TechnicalIndicators()
-            
+
         results = TechnicalIndicators()
-        
-        if 'RSI' in indicators:
-            results.rsi = self.calculate_rsi()
-            
-        if 'MACD' in indicators:
-            results.macd = self.calculate_macd()
-            
-        if 'BB' in indicators:
-            results.bollinger_bands = self.calculate_bollinger_bands()
-            
+
+        try:
+            close = self._close
+            n = self._n
+            if n < 2:
+                return results
+
+            # One fused pass computes all indicator states together;
+            # per-indicator warm-up lengths are masked below
+            rsi, macd, sig, hist, upper, middle, lower = _analyze_all(
+                close, 14, 12, 26, 9, 20, 2.0
+            )
+
+            # RSI(14) seeds from 14 deltas, i.e. 15 bars
+            if 'RSI' in indicators and n >= 15:
+                results.rsi = float(rsi)
+
+            if 'MACD' in indicators and n >= 26:
+                results.macd = {
+                    'macd_line': float(macd),
+                    'signal_line': float(sig),
+                    'histogram': float(hist)
+                }
+
+            if 'BB' in indicators and n >= 20:
+                results.bollinger_bands = {
+                    'upper_band': float(upper),
+                    'middle_band': float(middle),
+                    'lower_band': float(lower)
+                }
+
+        except Exception as e:
+            self.logger.error(f"Error during technical analysis: {str(e)}")
+
         return results
+
+def analyze_batch(
+    closes: List[np.ndarray],
+    indicators: FrozenSet[str]
+) -> List[TechnicalIndicators]:
+    """
+    Analyze many close series with a single parallel kernel call.
+
+    Args:
+        closes: One contiguous float64 close array per symbol
+        indicators: Set of indicators to calculate
+
+    Returns:
+        TechnicalIndicators per input series, in order, with the same
+        warm-up masking as TechnicalAnalyzer.analyze
+    """
+    if not closes:
+        return []
+
+    lengths = np.array([c.shape[0] for c in closes], dtype=np.int64)
+    padded = np.zeros((len(closes), int(lengths.max())), dtype=np.float64)
+    for i, close in enumerate(closes):
+        padded[i, :close.shape[0]] = close
+
+    rows = _analyze_batch(padded, lengths, 14, 12, 26, 9, 20, 2.0)
+
+    results = []
+    for i, n in enumerate(lengths):
+        result = TechnicalIndicators()
+        row = rows[i]
+
+        # RSI(14) seeds from 14 deltas, i.e. 15 bars
+        if 'RSI' in indicators and n >= 15:
+            result.rsi = float(row[0])
+
+        if 'MACD' in indicators and n >= 26:
+            result.macd = {
+                'macd_line': float(row[1]),
+                'signal_line': float(row[2]),
+                'histogram': float(row[3])
+            }
+
+        if 'BB' in indicators and n >= 20:
+            result.bollinger_bands = {
+                'upper_band': float(row[4]),
+                'middle_band': float(row[5]),
+                'lower_band': float(row[6])
+            }
+
+        results.append(result)
+
+    return results
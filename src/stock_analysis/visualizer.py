@@ -1,12 +1,66 @@
 """Visualization module for stock analysis."""
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import mplfinance as mpf
+
+# The plotting stack costs hundreds of ms to import, so it is loaded on
+# the first Visualizer construction rather than at module import; runs
+# that never plot skip the cost entirely
+plt = None
+mdates = None
+sns = None
+mpf = None
+
+def _import_plotting():
+    """Populate the plotting-library globals on first use."""
+    global plt, mdates, sns, mpf
+    if plt is not None:
+        return
+    import matplotlib
+    # Charts are only ever written to disk; the Agg backend skips GUI
+    # toolkit setup and must be selected before pyplot is imported
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    import seaborn as sns
+    import mplfinance as mpf
+
+def _aligned_closes(data: Dict[str, pd.DataFrame]):
+    """
+    Stack the CLOSE columns of several frames on their shared dates.
+
+    Frames covering different ranges are aligned by intersecting their
+    indexes, mirroring the alignment pandas applied implicitly before
+    the columns were stacked into one ndarray.
+
+    Args:
+        data: Dict of DataFrames with stock data
+
+    Returns:
+        Tuple of (shared DatetimeIndex, float64 matrix with one column
+        per symbol in dict order)
+
+    Raises:
+        ValueError: If the frames share no dates
+    """
+    frames = list(data.values())
+    index = frames[0].index
+    for df in frames[1:]:
+        index = index.intersection(df.index)
+
+    if index.empty:
+        raise ValueError(
+            f"no overlapping dates across symbols: {', '.join(data.keys())}"
+        )
+
+    mat = np.column_stack([
+        df['CLOSE'].reindex(index).to_numpy(dtype=np.float64)
+        for df in frames
+    ])
+    return index, mat
 
 class Visualizer:
     """Class for visualizing stock data and analysis results."""
@@ -14,7 +68,16 @@ class Visualizer:
     def __init__(self):
         """Initialize visualizer."""
         self.logger = logging.getLogger(__name__)
+        _import_plotting()
         self._setup_style()
+
+        # Reusable figures: constructing a figure per symbol per indicator
+        # dominates batch plotting time, so the same two figures are
+        # cleared and redrawn for every chart
+        self._fig, (self._ax1, self._ax2) = plt.subplots(
+            2, 1, figsize=(12, 8), height_ratios=[3, 1]
+        )
+        self._ind_fig, self._ind_ax = plt.subplots(figsize=(12, 6))
     
     def _setup_style(self):
         """Set up plotting style."""
@@ -27,17 +90,20 @@ class Visualizer:
         symbol: str,
         chart_type: str = 'line',
         indicators: Optional[List[str]] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        indicator_series: Optional[Dict[str, np.ndarray]] = None
     ) -> None:
         """
         Plot stock data with technical indicators.
-        
+
         Args:
             data: DataFrame with OHLCV data
             symbol: Stock symbol
             chart_type: Type of chart ('line' or 'candlestick')
             indicators: List of indicators to plot
             output_dir: Directory to save plots
+            indicator_series: Precomputed indicator arrays from the
+                analyzer; when given, plotting skips recomputation
         """
         try:
             # Create output directory if it doesn't exist
@@ -45,104 +111,193 @@ class Visualizer:
                 output_path = Path(output_dir)
                 output_path.mkdir(parents=True, exist_ok=True)
             
-            # Create figure and subplots
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), height_ratios=[3, 1])
-            
             # Plot price data
             if chart_type.lower() == 'candlestick':
+                # One mpf.plot call renders the candles, volume and every
+                # requested indicator as addplot panels, so no second
+                # figure pass is needed for this chart type
+                ohlc = data.rename(columns=str.capitalize)
+                apds = self._make_addplots(indicators, indicator_series)
+                kwargs = {}
+                if output_dir:
+                    kwargs['savefig'] = str(output_path / f'{symbol}_price.png')
                 mpf.plot(
-                    data,
+                    ohlc,
                     type='candle',
                     style='charles',
                     title=f'{symbol} Stock Price',
                     ylabel='Price',
-                    ax=ax1,
-                    volume=ax2
+                    volume=True,
+                    addplot=apds,
+                    **kwargs
                 )
-            else:
-                data['CLOSE'].plot(ax=ax1, label='Close Price')
-                ax1.set_title(f'{symbol} Stock Price')
-                ax1.set_ylabel('Price')
-                ax1.legend()
-                
-                # Plot volume
-                data['VOLUME'].plot(ax=ax2, label='Volume', color='gray', alpha=0.5)
-                ax2.set_ylabel('Volume')
-                ax2.legend()
-            
+                # Without precomputed series there were no overlays, so
+                # direct callers still get the per-indicator charts
+                if indicators and not indicator_series:
+                    self._plot_indicators(data, symbol, indicators, output_dir)
+                return
+
+            # Redraw on the shared figure instead of constructing a new one
+            ax1, ax2 = self._ax1, self._ax2
+            ax1.clear()
+            ax2.clear()
+
+            # Plot raw ndarrays directly, skipping the pandas plotting
+            # wrapper and its index-alignment machinery
+            dates = data.index.values
+            ax1.plot(dates, data['CLOSE'].to_numpy(), label='Close Price')
+            ax1.set_title(f'{symbol} Stock Price')
+            ax1.set_ylabel('Price')
+            ax1.legend()
+            ax1.xaxis.set_major_formatter(
+                mdates.ConciseDateFormatter(ax1.xaxis.get_major_locator())
+            )
+
+            # Plot volume
+            ax2.fill_between(
+                dates, data['VOLUME'].to_numpy(),
+                step='pre', alpha=0.5, color='gray', label='Volume'
+            )
+            ax2.set_ylabel('Volume')
+            ax2.legend()
+
             # Adjust layout and save
-            plt.tight_layout()
+            self._fig.tight_layout()
             if output_dir:
-                plt.savefig(output_path / f'{symbol}_price.png')
-                plt.close()
+                self._fig.savefig(output_path / f'{symbol}_price.png')
             
             # Plot technical indicators if specified
             if indicators:
-                self._plot_indicators(data, symbol, indicators, output_dir)
+                self._plot_indicators(
+                    data, symbol, indicators, output_dir, indicator_series
+                )
             
         except Exception as e:
             self.logger.error(f"Error plotting stock data for {symbol}: {str(e)}")
     
+    @staticmethod
+    def _make_addplots(
+        indicators: Optional[List[str]],
+        indicator_series: Optional[Dict[str, np.ndarray]]
+    ) -> List:
+        """
+        Build mplfinance addplot overlays from precomputed indicator arrays.
+
+        Args:
+            indicators: List of indicators to overlay
+            indicator_series: Precomputed indicator arrays from the analyzer
+
+        Returns:
+            List of addplot dicts; bands share the price panel while RSI
+            and MACD get panels below the volume panel
+        """
+        apds = []
+        if not indicators or not indicator_series:
+            return apds
+
+        if 'BB' in indicators and 'BB_MIDDLE' in indicator_series:
+            for key in ('BB_UPPER', 'BB_MIDDLE', 'BB_LOWER'):
+                apds.append(mpf.make_addplot(
+                    indicator_series[key], panel=0, width=0.8
+                ))
+        if 'RSI' in indicators and 'RSI' in indicator_series:
+            apds.append(mpf.make_addplot(
+                indicator_series['RSI'], panel=2, ylabel='RSI'
+            ))
+        if 'MACD' in indicators and 'MACD' in indicator_series:
+            panel = 3 if apds and apds[-1]['panel'] == 2 else 2
+            apds.append(mpf.make_addplot(
+                indicator_series['MACD'], panel=panel, ylabel='MACD'
+            ))
+            apds.append(mpf.make_addplot(
+                indicator_series['MACD_SIGNAL'], panel=panel
+            ))
+        return apds
+
     def _plot_indicators(
         self,
         data: pd.DataFrame,
         symbol: str,
         indicators: List[str],
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        indicator_series: Optional[Dict[str, np.ndarray]] = None
     ) -> None:
         """
         Plot technical indicators.
-        
+
         Args:
             data: DataFrame with OHLCV data
             symbol: Stock symbol
             indicators: List of indicators to plot
             output_dir: Directory to save plots
+            indicator_series: Precomputed indicator arrays; computed here
+                only when not provided
         """
         try:
+            precomputed = indicator_series or {}
+            index = data.index
+            ax = self._ind_ax
+
             for indicator in indicators:
-                plt.figure(figsize=(12, 6))
-                
+                ax.clear()
+
                 if indicator == 'RSI':
-                    # Calculate and plot RSI
-                    delta = data['CLOSE'].diff()
-                    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                    rs = gain / loss
-                    rsi = 100 - (100 / (1 + rs))
-                    
-                    plt.plot(rsi, label='RSI')
-                    plt.axhline(y=70, color='r', linestyle='--', alpha=0.5)
-                    plt.axhline(y=30, color='g', linestyle='--', alpha=0.5)
-                    
+                    if 'RSI' in precomputed:
+                        rsi = precomputed['RSI']
+                    else:
+                        # Branchless ndarray split + convolution instead of
+                        # the Series where/rolling path
+                        close = data['CLOSE'].to_numpy(dtype=np.float64)
+                        delta = np.diff(close)
+                        gains = np.maximum(delta, 0.0)
+                        losses = np.maximum(-delta, 0.0)
+                        window = np.full(14, 1.0 / 14)
+                        avg_gain = np.convolve(gains, window, mode='valid')
+                        avg_loss = np.convolve(losses, window, mode='valid')
+                        rsi = np.full(close.shape[0], np.nan)
+                        rsi[14:] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+                    ax.plot(index, rsi, label='RSI')
+                    ax.axhline(y=70, color='r', linestyle='--', alpha=0.5)
+                    ax.axhline(y=30, color='g', linestyle='--', alpha=0.5)
+
                 elif indicator == 'MACD':
-                    # Calculate and plot MACD
-                    exp1 = data['CLOSE'].ewm(span=12, adjust=False).mean()
-                    exp2 = data['CLOSE'].ewm(span=26, adjust=False).mean()
-                    macd = exp1 - exp2
-                    signal = macd.ewm(span=9, adjust=False).mean()
-                    
-                    plt.plot(macd, label='MACD')
-                    plt.plot(signal, label='Signal Line')
-                    plt.bar(data.index, macd - signal, label='Histogram', alpha=0.3)
-                    
+                    if 'MACD' in precomputed and 'MACD_SIGNAL' in precomputed:
+                        macd = precomputed['MACD']
+                        signal = precomputed['MACD_SIGNAL']
+                    else:
+                        exp1 = data['CLOSE'].ewm(span=12, adjust=False).mean()
+                        exp2 = data['CLOSE'].ewm(span=26, adjust=False).mean()
+                        macd = (exp1 - exp2).to_numpy()
+                        signal = pd.Series(macd).ewm(span=9, adjust=False).mean().to_numpy()
+
+                    ax.plot(index, macd, label='MACD')
+                    ax.plot(index, signal, label='Signal Line')
+                    ax.bar(index, macd - signal, label='Histogram', alpha=0.3)
+
                 elif indicator == 'BB':
-                    # Calculate and plot Bollinger Bands
-                    ma20 = data['CLOSE'].rolling(window=20).mean()
-                    std20 = data['CLOSE'].rolling(window=20).std()
-                    
-                    plt.plot(data['CLOSE'], label='Close Price')
-                    plt.plot(ma20, label='20-day MA')
-                    plt.plot(ma20 + (std20 * 2), label='Upper Band')
-                    plt.plot(ma20 - (std20 * 2), label='Lower Band')
-                
-                plt.title(f'{symbol} - {indicator}')
-                plt.legend()
-                plt.grid(True, alpha=0.3)
+                    if 'BB_MIDDLE' in precomputed:
+                        middle = precomputed['BB_MIDDLE']
+                        upper = precomputed['BB_UPPER']
+                        lower = precomputed['BB_LOWER']
+                    else:
+                        ma20 = data['CLOSE'].rolling(window=20).mean()
+                        std20 = data['CLOSE'].rolling(window=20).std()
+                        middle = ma20.to_numpy()
+                        upper = (ma20 + (std20 * 2)).to_numpy()
+                        lower = (ma20 - (std20 * 2)).to_numpy()
+
+                    ax.plot(index, data['CLOSE'].to_numpy(), label='Close Price')
+                    ax.plot(index, middle, label='20-day MA')
+                    ax.plot(index, upper, label='Upper Band')
+                    ax.plot(index, lower, label='Lower Band')
                 
+                ax.set_title(f'{symbol} - {indicator}')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+
                 if output_dir:
-                    plt.savefig(Path(output_dir) / f'{symbol}_{indicator}.png')
-                plt.close()
+                    self._ind_fig.savefig(Path(output_dir) / f'{symbol}_{indicator}.png')
                 
         except Exception as e:
             self.logger.error(f"Error plotting indicators for {symbol}: {str(e)}")
@@ -160,22 +315,24 @@ class Visualizer:
             output_dir: Directory to save plots
         """
         try:
-            plt.figure(figsize=(12, 6))
-            
-            for symbol, df in data.items():
-                # Normalize prices for comparison
-                normalized = df['CLOSE'] / df['CLOSE'].iloc[0] * 100
-                plt.plot(normalized, label=symbol)
-            
-            plt.title('Stock Price Comparison (Normalized)')
-            plt.ylabel('Normalized Price (%)')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-            
+            ax = self._ind_ax
+            ax.clear()
+
+            # Normalize all symbols in one broadcast divide by the first
+            # row, instead of a Series allocation per symbol; frames are
+            # aligned on their shared dates first
+            index, mat = _aligned_closes(data)
+            norm = mat / mat[0] * 100.0
+
+            ax.plot(index, norm)
+            ax.legend(list(data.keys()))
+            ax.set_title('Stock Price Comparison (Normalized)')
+            ax.set_ylabel('Normalized Price (%)')
+            ax.grid(True, alpha=0.3)
+
             if output_dir:
-                plt.savefig(Path(output_dir) / 'comparison.png')
-            plt.close()
-            
+                self._ind_fig.savefig(Path(output_dir) / 'comparison.png')
+
         except Exception as e:
             self.logger.error(f"Error plotting stock comparison: {str(e)}")
     
@@ -192,12 +349,14 @@ class Visualizer:
             output_dir: Directory to save plots
         """
         try:
-            # Create correlation matrix
-            returns = pd.DataFrame()
-            for symbol, df in data.items():
-                returns[symbol] = df['CLOSE'].pct_change()
-            
-            corr = returns.corr()
+            # Build the return matrix in numpy: one stacked array and one
+            # corrcoef call instead of per-symbol pct_change + column insert
+            symbols = list(data.keys())
+            _, closes = _aligned_closes(data)
+            rets = closes[1:] / closes[:-1] - 1.0
+            corr = pd.DataFrame(
+                np.corrcoef(rets.T), index=symbols, columns=symbols
+            )
             
             # Plot correlation matrix
             plt.figure(figsize=(10, 8))